@@ -12,12 +12,14 @@ from __future__ import annotations
 
 import threading
 import time
+from collections import deque
 from contextlib import contextmanager
 from dataclasses import dataclass, fields, replace
 from types import SimpleNamespace
 from typing import Callable, Literal, Sequence, TypeVar
 
 from rich.console import Console
+from rich.errors import LiveError
 from rich.live import Live
 from rich.panel import Panel
 from rich.rule import Rule
@@ -122,12 +124,18 @@ def get_braille_frame() -> int:
 # Name under which we register the braille spinner in Rich's SPINNERS dict.
 _BRAILLE_SPINNER_NAME = "braille"
 
+# Set once the braille spinner is in Rich's SPINNERS dict, so later calls are a flag check.
+_braille_registered = False
+
 
 def register_braille_spinner() -> None:
     """Register the braille spinner with Rich so console.status(..., spinner='braille') works.
 
     Idempotent; safe to call multiple times. Call once at startup or rely on braille_spinner_for_status().
     """
+    global _braille_registered
+    if _braille_registered:
+        return
     try:
         from rich import _spinners
 
@@ -136,7 +144,8 @@ def register_braille_spinner() -> None:
             "interval": 1000.0 / LIVE_REFRESH_PER_SECOND,
         }
     except (ImportError, AttributeError):
-        pass
+        return
+    _braille_registered = True
 
 
 def braille_spinner_for_status() -> str:
@@ -166,6 +175,9 @@ class TransientPanelConfig:
     padding: tuple[int, int] = (0, 1)
 
 
+# Field names accepted as overrides by _resolve_panel_config (computed once).
+_CONFIG_FIELD_NAMES: frozenset[str] = frozenset(f.name for f in fields(TransientPanelConfig))
+
 # Presets for consistent behavior across commands.
 TRANSIENT_PANEL_PRESETS: dict[str, TransientPanelConfig] = {
     "default": TransientPanelConfig(),
@@ -237,13 +249,12 @@ def key_value_panel(
     elif isinstance(lines[0], str):
         content = "\n".join(lines)
     else:
-        parts = []
-        for item in lines:
-            label, value = item[0], item[1]
-            if skip_none and value is None:
-                continue
-            parts.append(f"  {label_markup}{label}:[/] {value}")
-        content = "\n".join(parts)
+        prefix = f"  {label_markup}"
+        content = "\n".join([
+            f"{prefix}{label}:[/] {value}"
+            for label, value in lines
+            if not (skip_none and value is None)
+        ])
     return Panel(
         content,
         title=title,
@@ -259,13 +270,53 @@ def _resolve_panel_config(
 ) -> TransientPanelConfig:
     """Resolve config from preset, optional explicit config, and overrides."""
     base = config or TRANSIENT_PANEL_PRESETS.get(preset or "default") or TRANSIENT_PANEL_PRESETS["default"]
-    valid_names = {f.name for f in fields(TransientPanelConfig)}
-    clean = {k: v for k, v in overrides.items() if k in valid_names and v is not None}
+    # Common case: no overrides given, so reuse the preset (or explicit config) instance as-is.
+    if all(v is None for v in overrides.values()):
+        return base
+    clean = {k: v for k, v in overrides.items() if k in _CONFIG_FIELD_NAMES and v is not None}
     if not clean:
         return base
     return replace(base, **clean)
 
 
+# Process-wide Console used by transient_live_panel when the caller does not pass one.
+_default_console: Console | None = None
+_default_console_lock = threading.Lock()
+
+
+def _get_default_console() -> Console:
+    """Return the shared default Console, creating it on first use."""
+    global _default_console
+    if _default_console is None:
+        with _default_console_lock:
+            if _default_console is None:
+                _default_console = Console()
+    return _default_console
+
+
+def _markup_line(line: str) -> Text:
+    """Parse one line of panel output as Rich markup, falling back to plain text if invalid."""
+    try:
+        return Text.from_markup(line)
+    except Exception:
+        return Text(line)
+
+
+def _plain_output_panel(target_console: Console) -> SimpleNamespace:
+    """Panel API for non-terminal output: lines are printed as they arrive, no Live or spinner."""
+
+    def append(line: str) -> None:
+        target_console.print(_markup_line(line))
+
+    def set_status(text: str) -> None:
+        pass
+
+    def run_task(task_callable: Callable[[], T], *, sync: bool = False) -> T:
+        return task_callable()
+
+    return SimpleNamespace(append=append, set_status=set_status, run_task=run_task)
+
+
 @contextmanager
 def transient_live_panel(
     title: str,
@@ -289,12 +340,22 @@ def transient_live_panel(
     Optional kwargs override the preset (e.g. display_lines=30).
     Pass console= to use a specific Rich Console (e.g. with custom theme).
 
+    Pass sync=True to run_task for short tasks: the callable runs on the calling thread with
+    one render before and after, skipping the worker thread and refresh loop.
+
+    When the console is neither a terminal nor Jupyter (piped output, CI logs), no live panel
+    is shown: appended lines are printed directly, set_status is a no-op, and run_task runs
+    the callable on the calling thread.
+
+    Each append() is parsed as standalone Rich markup: tags must open and close within one line
+    (a "[red]" left open does not carry over to later lines). Invalid markup is shown as plain text.
+
     Yields an object with:
       - append(line: str) -> None
       - set_status(text: str) -> None   -- update the status line (e.g. "Downloading X...")
-      - run_task(task_callable: Callable[[], T]) -> T
+      - run_task(task_callable: Callable[[], T], *, sync: bool = False) -> T
     """
-    target_console = console if console is not None else Console()
+    target_console = console if console is not None else _get_default_console()
     cfg = _resolve_panel_config(
         preset=preset,
         config=config,
@@ -302,49 +363,112 @@ def transient_live_panel(
         display_lines=display_lines,
         border_style=border_style,
     )
-    lines_list: list[str] = []
-    current_status: list[str] = [cfg.default_status]
-    lock = threading.Lock()
+    # Same condition Live uses to decide whether it can draw at all.
+    if not (target_console.is_terminal or target_console.is_jupyter):
+        yield _plain_output_panel(target_console)
+        return
+    # Lines appended since the last render, bounded so the oldest are evicted once max_lines is
+    # reached. deque.append/popleft are atomic, so the buffer itself needs no lock; render()
+    # drains whatever arrived since the previous frame in one batch.
+    lines_list: deque[str] = deque(maxlen=cfg.max_lines)
+    # Status is a single reference store/load (atomic under the GIL), so it needs no lock.
+    state = SimpleNamespace(status=cfg.default_status)
+    dirty = threading.Event()
     result_holder: list = []
     try:
         console_height = target_console.size.height
-    except Exception:
+    except (OSError, AttributeError):
         console_height = 30
     tail = min(cfg.display_lines, max(1, console_height - cfg.reserve_lines))
-
+    # Parsed visible window: each line is parsed once when it first becomes visible and the
+    # joined Text is reused across frames where only the spinner advances. Bounded by max_lines
+    # too, since this is the only history kept once lines have been drained.
+    window = min(tail, cfg.max_lines)
+    visible_lines: deque[Text] = deque(maxlen=window)
+    streamed = Text("")
+    # Subtitle Texts for the current status, keyed by spinner frame and built on first use;
+    # cleared when the status changes.
+    status_lines_for: str | None = None
+    status_lines: dict[int, Text] = {}
+    # One Panel for the whole context; render() swaps in the current content and subtitle.
+    panel = Panel(
+        streamed,
+        title=title,
+        border_style=cfg.border_style,
+        padding=cfg.padding,
+        expand=True,
+    )
+    # Bound once here: append() runs per line and render() per frame, so avoid repeated lookups.
+    push_line = lines_list.append
+    pop_line = lines_list.popleft
+    is_dirty = dirty.is_set
+    mark_dirty = dirty.set
+    join_lines = Text("\n").join
+    spinner_len = len(SPINNER_BRAILLE)
+
+    # Event.set() takes the event's condition lock and notifies waiters, so only call it when the
+    # flag is clear. The refresh loop clears the flag before render() drains, so a line pushed
+    # after the drain always finds it clear and sets it again.
     def append(line: str) -> None:
-        with lock:
-            lines_list.append(line)
+        push_line(line)
+        if not is_dirty():
+            mark_dirty()
 
     def set_status(text: str) -> None:
-        with lock:
-            current_status[0] = text
-
-    def render() -> Panel:
-        with lock:
-            recent = lines_list[-cfg.max_lines:] if len(lines_list) > cfg.max_lines else lines_list
-            visible = recent[-tail:] if len(recent) > tail else recent
-            content = "\n".join(visible)
-            status_text = current_status[0]
-        if content:
+        state.status = text
+        if not is_dirty():
+            mark_dirty()
+
+    def render(tick: int = 0) -> Panel:
+        nonlocal streamed, status_lines_for
+        pending = len(lines_list)
+        status_text = state.status
+        if pending:
+            # Drain only what was queued when we looked; later appends wait for the next frame.
+            # Only the newest lines that can still be visible are kept for parsing.
+            newest: deque[str] = deque(maxlen=window)
+            for _ in range(pending):
+                newest.append(pop_line())
+            visible_lines.extend(map(_markup_line, newest))
+            streamed = join_lines(visible_lines)
+        if status_text != status_lines_for:
+            status_lines.clear()
+            status_lines_for = status_text
+        # The refresh loop renders once per frame interval, so its tick count is the frame index.
+        frame_idx = tick % spinner_len
+        status_line = status_lines.get(frame_idx)
+        if status_line is None:
+            # New Texts rather than mutating one in place: Live may be rendering the current one
+            # from the task's thread (when the task prints via the redirected stdout).
+            status_line = Text(f" {SPINNER_BRAILLE[frame_idx]} {status_text}", style="dim")
+            status_lines[frame_idx] = status_line
+        panel.renderable = streamed
+        panel.subtitle = status_line
+        return panel
+
+    def open_live() -> Live:
+        # Refreshes are driven by run_task, which already coalesces and paces frames, so each
+        # terminal write is exactly one frame; Live's own refresh thread would redraw on top.
+        frame = render()
+        live = Live(frame, auto_refresh=False, transient=True, console=target_console)
+        if console is None:
+            # Rich 13.x allows one Live per Console, so a panel opened while another one is live
+            # on the shared default Console gets a private Console instead.
             try:
-                streamed = Text.from_markup(content)
-            except Exception:
-                streamed = Text(content)
-        else:
-            streamed = Text("")
-        frame_idx = get_braille_frame()
-        status_line = Text(f" {SPINNER_BRAILLE[frame_idx]} {status_text}", style="dim")
-        return Panel(
-            streamed,
-            title=title,
-            subtitle=status_line,
-            border_style=cfg.border_style,
-            padding=cfg.padding,
-            expand=True,
-        )
-
-    def run_task(task_callable: Callable[[], T]) -> T:
+                live.start(refresh=True)
+            except LiveError:
+                live = Live(frame, auto_refresh=False, transient=True, console=Console())
+        return live
+
+    def run_task(task_callable: Callable[[], T], *, sync: bool = False) -> T:
+        if sync:
+            # Short tasks: run on this thread and render once before and once after.
+            with open_live() as live:
+                result = task_callable()
+                # No refresh here: Live draws the final frame as it stops, in the same write.
+                live.update(render())
+            return result
+
         result_holder.clear()
         exc_holder: list[BaseException | None] = [None]
 
@@ -353,19 +477,29 @@ def transient_live_panel(
                 result_holder.append(task_callable())
             except BaseException as e:
                 exc_holder[0] = e
+            finally:
+                # Wake the refresh loop so it exits as soon as the task ends.
+                dirty.set()
 
+        frame_interval = 1.0 / cfg.refresh_per_second
         th = threading.Thread(target=run)
         th.start()
-        with Live(
-            render(),
-            refresh_per_second=cfg.refresh_per_second,
-            transient=True,
-            console=target_console,
-        ) as live:
+        with open_live() as live:
+            tick = 0
+            next_render = time.monotonic()
             while th.is_alive():
-                live.update(render())
-                time.sleep(0.05)
-            live.update(render())
+                # Wake on new output/status, or after one frame interval to advance the spinner.
+                if dirty.wait(timeout=frame_interval):
+                    # Coalesce bursts of appends into at most one render per frame interval.
+                    delay = next_render - time.monotonic()
+                    if delay > 0:
+                        th.join(timeout=delay)
+                    dirty.clear()
+                tick += 1
+                live.update(render(tick), refresh=True)
+                next_render = time.monotonic() + frame_interval
+            # No refresh here: Live draws the final frame as it stops, in the same write.
+            live.update(render(tick))
         th.join()
         if exc_holder[0] is not None:
             raise exc_holder[0]
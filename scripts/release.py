@@ -1,12 +1,12 @@
 """Run version bump, clean dist, build, then twine upload. Used by: pipenv run release."""
 from __future__ import annotations
 
-import glob
 import re
 import shutil
 import subprocess
 import sys
 from pathlib import Path
+from typing import Callable, Sequence
 
 ROOT = Path(__file__).resolve().parent.parent
 PYPROJECT = ROOT / "pyproject.toml"
@@ -16,21 +16,20 @@ VERSION_PATTERN = re.compile(r'^version\s*=\s*["\'](\d+)\.(\d+)\.(\d+)["\']', re
 VERSION_REPLACEMENT = 'version = "{major}.{minor}.{patch}"'
 
 
-def get_current_version() -> tuple[int, int, int]:
+def get_current_version_and_text() -> tuple[str, tuple[int, int, int]]:
     text = PYPROJECT.read_text(encoding="utf-8")
     m = VERSION_PATTERN.search(text)
     if not m:
         raise SystemExit("Could not find version in pyproject.toml")
-    return int(m.group(1)), int(m.group(2)), int(m.group(3))
+    return text, (int(m.group(1)), int(m.group(2)), int(m.group(3)))
 
 
 def bump_patch(major: int, minor: int, patch: int) -> tuple[int, int, int]:
     return major, minor, patch + 1
 
 
-def set_version(major: int, minor: int, patch: int) -> None:
+def set_version(text: str, major: int, minor: int, patch: int) -> None:
     new_version = f"{major}.{minor}.{patch}"
-    text = PYPROJECT.read_text(encoding="utf-8")
     text = VERSION_PATTERN.sub(
         VERSION_REPLACEMENT.format(major=major, minor=minor, patch=patch), text, count=1
     )
@@ -45,24 +44,65 @@ def clean_dist() -> None:
     DIST_DIR.mkdir(parents=True, exist_ok=True)
 
 
+def _call_in_process(
+    entry: Callable[[Sequence[str]], object],
+    args: list[str],
+    expected_errors: tuple[type[Exception], ...] = (),
+) -> int:
+    """Call a CLI entry point in this interpreter and map its outcome to an exit code.
+
+    Only expected_errors (what the tool's own __main__ reports) are turned into a one-line
+    message; anything else propagates with its traceback.
+    """
+    try:
+        entry(args)
+    except SystemExit as e:
+        if e.code is None or isinstance(e.code, int):
+            return e.code or 0
+        print(e.code, file=sys.stderr)
+        return 1
+    except expected_errors as e:
+        print(f"{type(e).__name__}: {e}", file=sys.stderr)
+        return 1
+    return 0
+
+
+def run_build() -> int:
+    args = [str(ROOT), "--outdir", str(DIST_DIR)]
+    try:
+        from build.__main__ import main as build_main
+    except ImportError:
+        return subprocess.run([sys.executable, "-m", "build", *args], cwd=ROOT).returncode
+    return _call_in_process(build_main, args)
+
+
+def run_upload(dist_files: list[str]) -> int:
+    args = ["upload", *dist_files]
+    try:
+        from requests import HTTPError
+        from twine.cli import dispatch as twine_dispatch
+        from twine.exceptions import TwineException
+    except ImportError:
+        return subprocess.run([sys.executable, "-m", "twine", *args], cwd=ROOT).returncode
+    return _call_in_process(twine_dispatch, args, (TwineException, HTTPError))
+
+
 def main() -> int:
-    major, minor, patch = get_current_version()
+    text, (major, minor, patch) = get_current_version_and_text()
     major, minor, patch = bump_patch(major, minor, patch)
-    set_version(major, minor, patch)
+    set_version(text, major, minor, patch)
     clean_dist()
 
-    r = subprocess.run([sys.executable, "-m", "build"], cwd=ROOT)
-    if r.returncode != 0:
-        return r.returncode
+    returncode = run_build()
+    if returncode != 0:
+        return returncode
 
-    dist_files = sorted(glob.glob(str(ROOT / "dist" / "*")))
+    dist_files = sorted(str(p) for p in DIST_DIR.iterdir() if p.is_file() and not p.name.startswith("."))
     if not dist_files:
-        print("No files in dist/", file=sys.stderr)
+        print(f"No files in {DIST_DIR}", file=sys.stderr)
         return 1
-    return subprocess.run(
-        [sys.executable, "-m", "twine", "upload", *dist_files],
-        cwd=ROOT,
-    ).returncode
+    print(f"Uploading {len(dist_files)} file(s) from dist/")
+    return run_upload(dist_files)
 
 
 if __name__ == "__main__":